@@ -1,9 +1,42 @@
+import asyncio
+import aiofiles
+import aiohttp
+from aiohttp.resolver import AsyncResolver
+from aiohttp_client_cache import CachedSession as AsyncCachedSession, SQLiteBackend
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from urllib3.util.retry import Retry
+from lxml import etree
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 import logging
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
+from collections import Counter, OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from email.utils import parsedate_to_datetime
+import codecs
+import copy
+import hashlib
+import itertools
 import json
+import multiprocessing
+import os
+import re
+import socket
+import sqlite3
+import threading
 import time
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # uvloop doesn't support Windows; fall back to the default loop
+    uvloop = None
 
 # Configure logging
 logging.basicConfig(
@@ -12,39 +45,290 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given either as seconds or as an HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+_META_CHARSET = re.compile(rb'<meta[^>]+charset', re.IGNORECASE)
+_CONTENT_TYPE_CHARSET = re.compile(r'charset\s*=\s*["\']?([^\s;"\']+)', re.IGNORECASE)
+
+def _declares_charset(html: bytes) -> bool:
+    """Whether the page starts with a BOM or has a <meta charset> in its first 1024 bytes"""
+    return (html.startswith((codecs.BOM_UTF8, codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE))
+            or _META_CHARSET.search(html, 0, 1024) is not None)
+
+def _header_charset(content_type: Optional[str]) -> Optional[str]:
+    """Return the text encoding named by a Content-Type header, or None if absent or unknown"""
+    match = _CONTENT_TYPE_CHARSET.search(content_type or '')
+    if not match:
+        return None
+    try:
+        ''.encode(match.group(1))
+    except LookupError:
+        return None
+    return codecs.lookup(match.group(1)).name
+
+def _apply_header_charset(html: bytes, charset: Optional[str]) -> bytes:
+    """
+    Transcode the page to UTF-8 when only the HTTP header names its charset.
+    
+    parse_content() honours a BOM or <meta charset> and otherwise assumes UTF-8,
+    so a charset given solely in Content-Type would be lost without this.
+    """
+    if not charset or charset == 'utf-8' or _declares_charset(html):
+        return html
+    return html.decode(charset, errors='replace').encode('utf-8')
+
+# Pool workers are started fresh instead of forked from this process, whose
+# event loop and aiosqlite threads must not be duplicated into children
+_POOL_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+)
+
+def _json_bytes(obj) -> bytes:
+    """Serialize obj to compact JSON bytes, using orjson when it's installed"""
+    return orjson.dumps(obj) if orjson else json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode()
+
+async def _write_jsonl(queue: asyncio.Queue, f) -> None:
+    """
+    Append records from the queue to the open file f as JSON Lines until None is received.
+    
+    This is the only coroutine that writes to the file, so concurrent scrapers
+    never interleave partial lines.
+    """
+    while (record := await queue.get()) is not None:
+        await f.write(_json_bytes(record) + b'\n')
+
+class HostRateLimiter:
+    """
+    Token bucket throttling requests to a single host.
+    
+    The bucket refills at rate tokens per second up to burst tokens. Servers can
+    slow it down further through Retry-After and X-RateLimit-* response headers,
+    for at most max_pause seconds at a time.
+    """
+    def __init__(self, rate: float = 10.0, burst: int = 10, max_pause: float = 60.0):
+        self.rate = rate
+        self.burst = burst
+        self.max_pause = max_pause
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request to the host is allowed, then consume a token."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                
+                wait = self.paused_until - now
+                if wait <= 0:
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+                await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold off all requests to the host for the given number of seconds, up to max_pause."""
+        self.paused_until = max(self.paused_until, time.monotonic() + min(seconds, self.max_pause))
+
+    def update_from_headers(self, headers) -> None:
+        """
+        Adjust the bucket from the server's rate-limit headers.
+        
+        Args:
+            headers: Response headers (any case-insensitive mapping)
+        """
+        retry_after = _retry_after_seconds(headers.get('Retry-After'))
+        # Fetchers give up on a longer Retry-After rather than wait, so it
+        # mustn't stall the host's other requests either
+        if retry_after is not None and retry_after <= self.max_pause:
+            self.pause(retry_after)
+        
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is None or not remaining.isdigit():
+            return
+        self.tokens = min(self.tokens, float(remaining))
+        
+        reset = headers.get('X-RateLimit-Reset')
+        if int(remaining) == 0 and reset and reset.isdigit():
+            # Servers send either seconds until the reset or the reset's epoch time
+            reset = int(reset)
+            self.pause(reset - time.time() if reset >= 1_000_000_000 else reset)
+
 class WebScraper:
+    # One scraper is created per URL, so skip the per-instance __dict__
+    __slots__ = ('url', 'headers', '_session')
+    
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    BACKOFF_FACTOR = 0.5
+    # Longest Retry-After the async fetcher will wait out; URLs asking for more fail instead
+    MAX_RETRY_AFTER = 60.0
+    # requests-cache and aiohttp-client-cache use incompatible schemas, so each gets its own file
+    CACHE_NAME = 'scrape_cache.sqlite'
+    ASYNC_CACHE_NAME = 'scrape_cache_async.sqlite'
+    CACHE_EXPIRE_AFTER = 3600
+    DNS_NAMESERVERS = ['1.1.1.1', '8.8.8.8']
+    # scrape_many only starts a process pool for batches at least this large
+    PROCESS_POOL_MIN_URLS = 8
+    # Extracted data keyed by a digest of the page HTML: in-memory LRU backed by SQLite.
+    # Bump EXTRACT_VERSION whenever a change to the extractors alters their output.
+    EXTRACT_CACHE_NAME = 'scrape_cache_extract.sqlite'
+    EXTRACT_CACHE_MAX_ENTRIES = 10000
+    # Expired and surplus rows are pruned once per this many writes, not on every insert
+    EXTRACT_CACHE_PRUNE_EVERY = 100
+    EXTRACT_MEMO_SIZE = 128
+    EXTRACT_VERSION = 1
+    _extract_memo: 'OrderedDict[str, Tuple[float, Dict]]' = OrderedDict()
+    # One connection per process, shared by every scraper; the lock also guards
+    # the memo, since scrape_async() reaches the cache from worker threads
+    _extract_db: Optional[sqlite3.Connection] = None
+    _extract_lock = threading.Lock()
+    _extract_writes = 0
+    # Tags removed from the parsed tree before extraction, for subclasses whose
+    # extractors would otherwise pick up their contents (None keeps everything)
+    STRIP_TAGS: Optional[List[str]] = None
+
     def __init__(self, url: str):
         self.url = url
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        self._session: Optional[CachedSession] = None
 
-    def fetch_page(self) -> str:
+    @property
+    def session(self) -> CachedSession:
+        """
+        Synchronous HTTP session, created on first use.
+        
+        Keep-alive pooling lets repeated fetches reuse TCP/TLS connections, and
+        responses are cached on disk and revalidated per Cache-Control/ETag.
+        Creating it lazily keeps the async path and extraction-only scrapers
+        from opening the SQLite cache they never use.
+        """
+        if self._session is None:
+            self._session = CachedSession(
+                self.CACHE_NAME,
+                backend='sqlite',
+                expire_after=self.CACHE_EXPIRE_AFTER,
+                cache_control=True,
+                stale_if_error=True
+            )
+            self._session.headers.update(self.headers)
+            adapter = HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=64,
+                max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=self.RETRY_STATUSES)
+            )
+            self._session.mount('https://', adapter)
+            self._session.mount('http://', adapter)
+        return self._session
+
+    def __enter__(self) -> 'WebScraper':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections, if opened."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def fetch_page(self) -> bytes:
         """
         Fetch the webpage content.
         
         Returns:
-            str: HTML content of the page
+            bytes: Raw HTML content of the page, left undecoded for the parser
+                unless only the Content-Type header declares its charset
         """
         try:
-            response = requests.get(self.url, headers=self.headers)
+            response = self.session.get(self.url, timeout=10)
             response.raise_for_status()
-            return response.text
+            return _apply_header_charset(response.content, _header_charset(response.headers.get('Content-Type')))
         except requests.RequestException as e:
             logger.error(f"Error fetching the page: {e}")
-            return ""
+            return b""
+
+    async def fetch_page_async(self, session: aiohttp.ClientSession, max_retries: int = 3,
+                               limiter: Optional[HostRateLimiter] = None) -> bytes:
+        """
+        Fetch the webpage content without blocking the event loop.
+        
+        Responses with a status in RETRY_STATUSES are retried up to max_retries
+        times, waiting for the server's Retry-After or else backing off
+        exponentially. A Retry-After longer than MAX_RETRY_AFTER is not waited
+        out; the response's error status is raised instead.
+        
+        Args:
+            session (aiohttp.ClientSession): Session shared by all concurrent fetches
+            max_retries (int): Maximum number of retries on 429/5xx responses
+            limiter (Optional[HostRateLimiter]): Rate limiter for the URL's host
+            
+        Returns:
+            bytes: Raw HTML content of the page, left undecoded for the parser
+                unless only the Content-Type header declares its charset
+            
+        Raises:
+            asyncio.TimeoutError: If the session timeout expires
+            aiohttp.ClientError: On connection errors or a non-retryable error status
+        """
+        for attempt in range(max_retries + 1):
+            if limiter:
+                await limiter.acquire()
+            async with session.get(self.url, headers=self.headers) as response:
+                if limiter:
+                    limiter.update_from_headers(response.headers)
+                if response.status not in self.RETRY_STATUSES or attempt == max_retries:
+                    response.raise_for_status()
+                    return _apply_header_charset(await response.read(),
+                                                 _header_charset(response.headers.get('Content-Type')))
+                
+                delay = _retry_after_seconds(response.headers.get('Retry-After'))
+                if delay is None:
+                    delay = self.BACKOFF_FACTOR * 2 ** attempt
+                elif delay > self.MAX_RETRY_AFTER:
+                    logger.warning(f"Got HTTP {response.status} from {self.url} with Retry-After "
+                                   f"{delay:.1f}s, longer than {self.MAX_RETRY_AFTER:.1f}s; giving up")
+                    response.raise_for_status()
+            
+            logger.warning(f"Got HTTP {response.status} from {self.url}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
 
-    def parse_content(self, html: str) -> BeautifulSoup:
+    def parse_content(self, html: bytes, strip_tags: Optional[List[str]] = None) -> LexborHTMLParser:
         """
-        Parse HTML content using BeautifulSoup.
+        Parse HTML content using selectolax's lexbor backend.
         
         Args:
-            html (str): HTML content to parse
+            html (bytes): Raw HTML content to parse; the encoding is detected
+                from a BOM or <meta charset> declaration, defaulting to UTF-8
+            strip_tags (Optional[List[str]]): Tags to drop, along with their
+                subtrees, after parsing so extractors never see their contents.
+                This is an extra pass over the tree, not a parsing shortcut.
+                None keeps the full tree.
             
         Returns:
-            BeautifulSoup: Parsed HTML
+            LexborHTMLParser: Parsed HTML
         """
-        return BeautifulSoup(html, 'lxml')
+        tree = LexborHTMLParser(html, encoding=True)
+        if strip_tags:
+            tree.strip_tags(strip_tags)
+        return tree
 
     def scrape(self) -> Dict:
         """
@@ -58,60 +342,416 @@ class WebScraper:
         if not html:
             return {}
         
-        soup = self.parse_content(html)
-        return self._extract_data(soup)
+        return self._extract_cached(html)
+
+    def scrape_stream(self) -> Dict:
+        """
+        Scrape by feeding the response body to stream_extract() chunk by chunk.
+        
+        Meant for pages too large to hold in memory; the HTTP cache is bypassed
+        since caching would read the whole body anyway.
+        
+        Returns:
+            Dict: Scraped data
+        """
+        logger.info(f"Starting to stream {self.url}")
+        try:
+            with self.session.cache_disabled():
+                with self.session.get(self.url, timeout=10, stream=True) as response:
+                    response.raise_for_status()
+                    return self.stream_extract(response)
+        except requests.RequestException as e:
+            logger.error(f"Error fetching the page: {e}")
+            return {}
+
+    async def scrape_async(self, session: aiohttp.ClientSession,
+                           limiter: Optional[HostRateLimiter] = None,
+                           executor: Optional[Executor] = None) -> Dict:
+        """
+        Asynchronous counterpart of scrape(), fetching through a shared session.
+        
+        Args:
+            session (aiohttp.ClientSession): Session shared by all concurrent fetches
+            limiter (Optional[HostRateLimiter]): Rate limiter for the URL's host
+            executor (Optional[Executor]): Process pool to parse and extract in,
+                keeping the CPU-bound stage off the event loop. None runs it inline.
+            
+        Returns:
+            Dict: Scraped data
+        """
+        logger.info(f"Starting to scrape {self.url}")
+        html = await self.fetch_page_async(session, limiter=limiter)
+        if not html:
+            return {}
+        
+        if executor is None:
+            return self._extract_cached(html)
+        
+        # The cache stays in this process; only misses are shipped to a worker.
+        # Its SQLite I/O runs in a thread so it doesn't stall the event loop.
+        key = self._extract_cache_key(html)
+        data = await asyncio.to_thread(self._load_extracted, key)
+        if data is None:
+            loop = asyncio.get_running_loop()
+            data = await loop.run_in_executor(executor, _parse_and_extract, html, type(self), self.url)
+            await asyncio.to_thread(self._store_extracted, key, data)
+        return data
+
+    @classmethod
+    async def scrape_many(cls, urls: List[str], concurrency: int = 20, timeout: float = 10,
+                          rate_per_host: float = 10.0, output_path: Optional[str] = None) -> List[Dict]:
+        """
+        Scrape several URLs concurrently over one pooled aiohttp session.
+        
+        At most concurrency requests are in flight at once, so large URL lists
+        don't pile up into a storm of timeouts, and each host gets its own
+        HostRateLimiter so no single server is hammered. Batches of at least
+        PROCESS_POOL_MIN_URLS pages are parsed and extracted in a pool of up to
+        one worker process per CPU; smaller ones are extracted inline.
+        
+        Args:
+            urls (List[str]): URLs to scrape
+            concurrency (int): Maximum number of URLs scraped at the same time
+            timeout (float): Total time budget in seconds for each request
+            rate_per_host (float): Sustained requests per second allowed per host
+            output_path (Optional[str]): JSON Lines file to append one record per
+                URL to as soon as it's scraped. It's opened before any URL is
+                fetched; if writing fails later on, the error is logged and the
+                results are still returned.
+            
+        Returns:
+            List[Dict]: Scraped data for each URL, in the same order as urls.
+                Failed or timed-out URLs yield an empty dict.
+            
+        Raises:
+            OSError: If output_path can't be opened for appending
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        failures = Counter()
+        limiters: Dict[str, HostRateLimiter] = {}
+        queue: Optional[asyncio.Queue] = asyncio.Queue() if output_path else None
+        
+        async def scrape_one(url: str) -> Dict:
+            host = urlsplit(url).netloc
+            if host not in limiters:
+                limiters[host] = HostRateLimiter(rate_per_host, burst=max(1, int(rate_per_host)),
+                                                 max_pause=cls.MAX_RETRY_AFTER)
+            
+            data = {}
+            async with semaphore:
+                try:
+                    with cls(url) as scraper:
+                        data = await scraper.scrape_async(session, limiters[host], pool)
+                except asyncio.TimeoutError:
+                    failures['timeouts'] += 1
+                    logger.error(f"Timed out scraping {url}")
+                except aiohttp.ClientError as e:
+                    failures['errors'] += 1
+                    logger.error(f"Error scraping {url}: {e}")
+                except Exception:
+                    # Extractor bugs, cache or worker failures must not sink the whole batch
+                    failures['errors'] += 1
+                    logger.exception(f"Unexpected error scraping {url}")
+            
+            # Stop queueing once the writer has died, or records would pile up undrained
+            if queue is not None and not writer.done():
+                queue.put_nowait({'url': url, 'scraped_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'), 'data': data})
+            return data
+        
+        # Resolve through c-ares (aiodns) instead of the threaded getaddrinfo pool,
+        # IPv4 only to skip dual-stack attempts that tend to time out
+        resolver = AsyncResolver(nameservers=cls.DNS_NAMESERVERS)
+        connector = aiohttp.TCPConnector(
+            resolver=resolver,
+            family=socket.AF_INET,
+            limit=1024,
+            limit_per_host=64,
+            ttl_dns_cache=300
+        )
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+        cache = SQLiteBackend(cls.ASYNC_CACHE_NAME, expire_after=cls.CACHE_EXPIRE_AFTER, cache_control=True)
+        # Open the output first, so a bad path fails before anything is fetched
+        output = await aiofiles.open(output_path, 'ab') if output_path else None
+        writer = asyncio.create_task(_write_jsonl(queue, output)) if output is not None else None
+        pool = None
+        if len(urls) >= cls.PROCESS_POOL_MIN_URLS:
+            pool = ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(urls)), mp_context=_POOL_CONTEXT)
+        try:
+            async with AsyncCachedSession(cache=cache, connector=connector, timeout=client_timeout) as session:
+                results = await asyncio.gather(*(scrape_one(url) for url in urls))
+        finally:
+            if pool is not None:
+                pool.shutdown()
+            if writer is not None:
+                queue.put_nowait(None)
+                try:
+                    try:
+                        await writer
+                    finally:
+                        await output.close()
+                except Exception:
+                    # The scraped results are still returned even if they couldn't all be saved
+                    logger.exception(f"Error writing results to {output_path}")
+        
+        logger.info(
+            f"Scraped {len(urls) - sum(failures.values())}/{len(urls)} URLs "
+            f"({failures['timeouts']} timeouts, {failures['errors']} errors)"
+        )
+        return results
     
-    def _extract_data(self, soup: BeautifulSoup) -> Dict:
+    def _extract_cached(self, html: bytes) -> Dict:
+        """
+        Parse and extract the HTML, reusing earlier results for identical pages.
+        
+        Results are keyed by the scraper class, its EXTRACT_VERSION and a BLAKE2b
+        digest of the HTML, kept in an in-memory LRU and persisted to
+        EXTRACT_CACHE_NAME so that unchanged pages skip parsing and extraction
+        across runs. Entries expire after CACHE_EXPIRE_AFTER seconds.
+        
+        Args:
+            html (bytes): Raw HTML content to parse
+            
+        Returns:
+            Dict: Extracted data
+        """
+        key = self._extract_cache_key(html)
+        data = self._load_extracted(key)
+        if data is None:
+            data = self._extract_data(self.parse_content(html, self.STRIP_TAGS))
+            self._store_extracted(key, data)
+        return data
+
+    def _extract_cache_key(self, html: bytes) -> str:
+        """Build the extract cache key for a page"""
+        digest = hashlib.blake2b(html, digest_size=16).hexdigest()
+        return f"{type(self).__name__}:v{self.EXTRACT_VERSION}:{digest}"
+
+    def _connect_extract_cache(self) -> sqlite3.Connection:
+        """
+        Return the process-wide extract cache connection, opening it on first use.
+        
+        Must be called with _extract_lock held.
+        """
+        if WebScraper._extract_db is None:
+            db = sqlite3.connect(self.EXTRACT_CACHE_NAME, check_same_thread=False)
+            try:
+                # A cache can afford to lose its last writes on power loss, so skip the per-commit fsync
+                db.execute('PRAGMA journal_mode=WAL')
+                db.execute('PRAGMA synchronous=NORMAL')
+                db.execute(
+                    'CREATE TABLE IF NOT EXISTS extract_cache '
+                    '(key TEXT PRIMARY KEY, data TEXT NOT NULL, created REAL NOT NULL)'
+                )
+                db.execute('CREATE INDEX IF NOT EXISTS extract_cache_created ON extract_cache (created)')
+            except sqlite3.Error:
+                db.close()
+                raise
+            WebScraper._extract_db = db
+        return WebScraper._extract_db
+
+    def _load_extracted(self, key: str) -> Optional[Dict]:
+        """
+        Look up previously extracted data.
+        
+        Returns:
+            Optional[Dict]: A private copy of the cached data, or None on a miss
+        """
+        now = time.time()
+        memo = WebScraper._extract_memo
+        with WebScraper._extract_lock:
+            if key in memo:
+                created, data = memo[key]
+                if now - created < self.CACHE_EXPIRE_AFTER:
+                    memo.move_to_end(key)
+                    return copy.deepcopy(data)
+                del memo[key]
+            
+            try:
+                row = self._connect_extract_cache().execute(
+                    'SELECT data, created FROM extract_cache WHERE key = ? AND created > ?',
+                    (key, now - self.CACHE_EXPIRE_AFTER)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"Extract cache lookup failed: {e}")
+                return None
+            if row is None:
+                return None
+            
+            data = json.loads(row[0])
+            self._remember_extracted(key, row[1], data)
+        return data
+
+    def _store_extracted(self, key: str, data: Dict) -> None:
+        """
+        Save extracted data to the memo and the on-disk cache.
+        
+        Every EXTRACT_CACHE_PRUNE_EVERY writes, expired rows are deleted and the
+        table is trimmed back to EXTRACT_CACHE_MAX_ENTRIES, oldest first.
+        """
+        now = time.time()
+        with WebScraper._extract_lock:
+            self._remember_extracted(key, now, data)
+            try:
+                db = self._connect_extract_cache()
+                with db:
+                    db.execute('INSERT OR REPLACE INTO extract_cache VALUES (?, ?, ?)', (key, json.dumps(data), now))
+                    WebScraper._extract_writes += 1
+                    if WebScraper._extract_writes % self.EXTRACT_CACHE_PRUNE_EVERY == 0:
+                        self._prune_extract_cache(db, now)
+            except sqlite3.Error as e:
+                logger.warning(f"Extract cache update failed: {e}")
+
+    def _prune_extract_cache(self, db: sqlite3.Connection, now: float) -> None:
+        """Delete expired rows and the oldest rows beyond EXTRACT_CACHE_MAX_ENTRIES"""
+        # Both deletes walk the index on created instead of sorting the table
+        db.execute('DELETE FROM extract_cache WHERE created <= ?', (now - self.CACHE_EXPIRE_AFTER,))
+        db.execute(
+            'DELETE FROM extract_cache WHERE created <= '
+            '(SELECT created FROM extract_cache ORDER BY created DESC LIMIT 1 OFFSET ?)',
+            (self.EXTRACT_CACHE_MAX_ENTRIES,)
+        )
+
+    def _remember_extracted(self, key: str, created: float, data: Dict) -> None:
+        """Keep a private copy of extracted data in the in-memory LRU"""
+        memo = WebScraper._extract_memo
+        memo[key] = (created, copy.deepcopy(data))
+        memo.move_to_end(key)
+        if len(memo) > self.EXTRACT_MEMO_SIZE:
+            memo.popitem(last=False)
+
+    def _extract_data(self, tree: LexborHTMLParser) -> Dict:
         """
         Extract data from the parsed HTML. Override this in subclasses.
         
         Args:
-            soup (BeautifulSoup): Parsed HTML
+            tree (LexborHTMLParser): Parsed HTML
             
         Returns:
             Dict: Extracted data
         """
         return {}
 
+    def stream_extract(self, response: requests.Response) -> Dict:
+        """
+        Extract data from a streamed response without building the full tree.
+        Override this in subclasses.
+        
+        Args:
+            response (requests.Response): Response opened with stream=True
+            
+        Returns:
+            Dict: Extracted data
+        """
+        return {}
+
+def _discard_element(element: etree._Element) -> None:
+    """Free a closed element and the already-processed siblings before it"""
+    element.clear(keep_tail=True)
+    while element.getprevious() is not None:
+        del element.getparent()[0]
+
+def _parse_and_extract(html: bytes, scraper_cls: type, url: str) -> Dict:
+    """
+    Process pool entry point: parse and extract a fetched page in a worker.
+    
+    Only the CPU-bound stage runs here. The scraper never opens its HTTP session,
+    and the extract cache is read and written by the parent process, so workers
+    don't contend for its SQLite file.
+    """
+    scraper = scraper_cls(url)
+    return scraper._extract_data(scraper.parse_content(html, scraper.STRIP_TAGS))
+
 class BuyGoodsScraper(WebScraper):
-    def __init__(self):
-        super().__init__("https://buygoods.com")
+    __slots__ = ()
+    
+    DEFAULT_URL = "https://buygoods.com"
+    # Their contents would otherwise leak into extraction: script text can match
+    # the contact phrases, and an inline <svg><title> can shadow the page title
+    STRIP_TAGS = ['script', 'style', 'noscript', 'template', 'svg', 'iframe']
+    EXTRACT_VERSION = 2
+    
+    # CSS selectors, evaluated by lexbor in C rather than through per-node Python callbacks
+    _SEL_PAGE = ':is(title, h4, [class*="testimonial" i])'
+    # Outermost div/section elements: a nested one's text is a substring of its
+    # ancestor's, so the first outermost match is the first match overall
+    _SEL_CONTACT_CANDIDATES = ':is(div, section):not(:is(div, section) *)'
+    _SEL_QUOTE = 'p, div'
+    _SEL_AUTHOR = 'h4, h5, strong'
+    _SEL_SOCIAL = ('a:is([href*="facebook" i], [href*="twitter" i], '
+                   '[href*="linkedin" i], [href*="instagram" i])')
+    # Headings starting with these are footer notices, not features
+    _COPYRIGHT_PREFIXES = ('©', 'Copyright', '(c)')
+    # Case-insensitive matcher compiled once, so nodes are tested without lowercased copies
+    _TESTIMONIAL_CLASS = re.compile('testimonial', re.IGNORECASE)
+    _CONTACT_TEXT = re.compile('contact|get in touch', re.IGNORECASE)
+    _SOCIAL_HREF = re.compile('facebook|twitter|linkedin|instagram', re.IGNORECASE)
+    # Elements stream_extract() reads; everything else is discarded as it closes
+    _STREAM_TAGS = ('title', 'h4', 'a')
+    _STREAM_CHUNK_SIZE = 65536
+
+    def __init__(self, url: str = DEFAULT_URL):
+        super().__init__(url)
         
-    def _extract_data(self, soup: BeautifulSoup) -> Dict:
+    def _extract_data(self, tree: LexborHTMLParser) -> Dict:
         """
         Extract relevant information from BuyGoods.com
+        
+        Title, feature and testimonial elements are collected in a single
+        document-order pass and dispatched by tag, instead of scanning the
+        tree once per field. The contact section is the first div/section whose
+        full text mentions contact, checking only outermost candidates so each
+        text node is read once.
         """
+        title = None
+        feature_elements = []
+        testimonial_sections = []
+        
+        for node in tree.css(self._SEL_PAGE):
+            tag = node.tag
+            if tag == 'title':
+                if title is None:
+                    title = node
+            elif tag == 'h4':
+                feature_elements.append(node)
+            
+            if self._TESTIMONIAL_CLASS.search(node.attributes.get('class') or ''):
+                testimonial_sections.append(node)
+        
+        contact_section = next((node for node in tree.css(self._SEL_CONTACT_CANDIDATES)
+                                if self._CONTACT_TEXT.search(node.text())), None)
+        
         data = {
-            'title': self._get_text(soup.find('title')),
-            'features': self._extract_features(soup),
-            'testimonials': self._extract_testimonials(soup),
-            'contact_info': self._extract_contact_info(soup)
+            'title': self._get_text(title),
+            'features': self._extract_features(feature_elements),
+            'testimonials': self._extract_testimonials(testimonial_sections),
+            'contact_info': self._extract_contact_info(contact_section)
         }
         
         return data
     
-    def _get_text(self, element) -> str:
-        """Helper method to safely extract text from BS4 element"""
-        return element.get_text(strip=True) if element else ""
+    def _get_text(self, node) -> str:
+        """Helper method to safely extract text from a selectolax node"""
+        return node.text(strip=True) if node else ""
     
-    def _extract_features(self, soup: BeautifulSoup) -> List[str]:
-        """Extract platform features"""
-        features = []
-        feature_elements = soup.find_all('h4')
-        for feature in feature_elements:
-            text = self._get_text(feature)
-            if text and not text.startswith('©'):
-                features.append(text)
-        return features
+    def _extract_features(self, feature_elements: List[LexborNode]) -> List[str]:
+        """Extract platform features from the page's h4 headings"""
+        return [
+            text for text in (self._get_text(feature) for feature in feature_elements)
+            if text and not text.startswith(self._COPYRIGHT_PREFIXES)
+        ]
     
-    def _extract_testimonials(self, soup: BeautifulSoup) -> List[Dict]:
-        """Extract testimonials"""
+    def _extract_testimonials(self, testimonial_sections: List[LexborNode]) -> List[Dict]:
+        """Extract testimonials from the testimonial containers"""
         testimonials = []
-        testimonial_sections = soup.find_all(class_=lambda x: x and 'testimonial' in x.lower())
         
         for section in testimonial_sections:
-            quote = section.find(lambda tag: tag.name in ['p', 'div'] and tag.get_text(strip=True))
-            author = section.find(lambda tag: tag.name in ['h4', 'h5', 'strong'])
+            # Node.css() also matches the node itself, so skip the section. Compare
+            # by mem_id: node equality serializes both subtrees to HTML.
+            section_id = section.mem_id
+            quote = next((tag for tag in section.css(self._SEL_QUOTE)
+                          if tag.mem_id != section_id and tag.text(strip=True)), None)
+            author = next((tag for tag in section.css(self._SEL_AUTHOR)
+                           if tag.mem_id != section_id), None)
             
             if quote and author:
                 testimonials.append({
@@ -121,51 +761,117 @@ class BuyGoodsScraper(WebScraper):
         
         return testimonials
     
-    def _extract_contact_info(self, soup: BeautifulSoup) -> Dict:
-        """Extract contact information"""
+    def _extract_contact_info(self, contact_section: Optional[LexborNode]) -> Dict:
+        """Extract contact information from the contact section, if any"""
         contact_info = {}
         
-        # Look for contact section
-        contact_section = soup.find(lambda tag: tag.name in ['div', 'section'] and 
-                                  any(text in tag.get_text().lower() for text in ['contact', 'get in touch']))
-        
         if contact_section:
             # Extract social media links
-            social_links = contact_section.find_all('a', href=True)
             contact_info['social_media'] = [
-                link['href'] for link in social_links 
-                if any(platform in link['href'].lower() 
-                      for platform in ['facebook', 'twitter', 'linkedin', 'instagram'])
+                link.attributes['href'] for link in contact_section.css(self._SEL_SOCIAL)
             ]
             
         return contact_info
 
+    def stream_extract(self, response: requests.Response) -> Dict:
+        """
+        Extract data from a streamed response, in the same shape as _extract_data().
+        
+        The body is fed to lxml's incremental parser and every element is freed
+        as soon as it closes, so memory is bounded by the chunk size rather than
+        the page size. Testimonials and the contact section need whole subtrees,
+        so 'testimonials' is always empty and contact_info['social_media'] holds
+        the social links found anywhere on the page, not just in the contact
+        section.
+        """
+        title = None
+        features = []
+        social_media = []
+        open_targets = 0
+        
+        # Like fetch_page(), honour a BOM or <meta charset>, then the Content-Type
+        # charset, and otherwise assume UTF-8. A header charset is decoded in
+        # Python and fed on as UTF-8, since libxml2 doesn't know every codec
+        # Python does (EUC-JP, mac-roman, ...).
+        chunks = response.iter_content(chunk_size=self._STREAM_CHUNK_SIZE)
+        first_chunk = next(chunks, b'')
+        decoder = None
+        if _declares_charset(first_chunk):
+            encoding = None
+        else:
+            encoding = 'utf-8'
+            charset = _header_charset(response.headers.get('Content-Type'))
+            if charset and charset != 'utf-8':
+                decoder = codecs.getincrementaldecoder(charset)(errors='replace')
+        parser = etree.HTMLPullParser(events=('start', 'end'), encoding=encoding)
+        
+        def handle_events():
+            nonlocal title, open_targets
+            for event, element in parser.read_events():
+                if element.tag not in self._STREAM_TAGS:
+                    # Children of a target are kept until the target itself closes
+                    if event == 'end' and not open_targets:
+                        _discard_element(element)
+                    continue
+                
+                if event == 'start':
+                    open_targets += 1
+                    continue
+                open_targets -= 1
+                
+                if element.tag == 'a':
+                    href = element.get('href') or ''
+                    if self._SOCIAL_HREF.search(href):
+                        social_media.append(href)
+                else:
+                    text = ''.join(element.itertext()).strip()
+                    if element.tag == 'title':
+                        if title is None:
+                            title = text
+                    elif text and not text.startswith(self._COPYRIGHT_PREFIXES):
+                        features.append(text)
+                
+                if not open_targets:
+                    _discard_element(element)
+        
+        for chunk in itertools.chain([first_chunk], chunks):
+            parser.feed(decoder.decode(chunk).encode('utf-8') if decoder else chunk)
+            handle_events()
+        if decoder:
+            parser.feed(decoder.decode(b'', final=True).encode('utf-8'))
+        parser.close()
+        handle_events()
+        
+        return {
+            'title': title or "",
+            'features': features,
+            'testimonials': [],
+            'contact_info': {'social_media': social_media}
+        }
+
 def main():
-    scraper = BuyGoodsScraper()
+    urls = [BuyGoodsScraper.DEFAULT_URL]
+    run = uvloop.run if uvloop else asyncio.run
     
     try:
-        results = scraper.scrape()
-        
-        # Save results to a JSON file
-        timestamp = time.strftime("%Y%m%d-%H%M%S")
-        output_file = f"buygoods_data_{timestamp}.json"
+        # Append one JSON record per URL to a rolling JSON Lines file
+        output_file = "buygoods_data.jsonl"
+        results = dict(zip(urls, run(BuyGoodsScraper.scrape_many(urls, output_path=output_file))))
         
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2)
-            
-        logger.info(f"Data has been saved to {output_file}")
+        logger.info(f"Data has been appended to {output_file}")
         
         # Display some results
-        if results.get('features'):
-            logger.info("\nPlatform Features:")
-            for feature in results['features']:
-                logger.info(f"- {feature}")
-                
-        if results.get('testimonials'):
-            logger.info("\nTestimonials:")
-            for testimonial in results['testimonials']:
-                logger.info(f"Quote: {testimonial['quote']}")
-                logger.info(f"Author: {testimonial['author']}\n")
+        for url, data in results.items():
+            if data.get('features'):
+                logger.info(f"\nPlatform Features ({url}):")
+                for feature in data['features']:
+                    logger.info(f"- {feature}")
+                    
+            if data.get('testimonials'):
+                logger.info(f"\nTestimonials ({url}):")
+                for testimonial in data['testimonials']:
+                    logger.info(f"Quote: {testimonial['quote']}")
+                    logger.info(f"Author: {testimonial['author']}\n")
             
     except Exception as e:
         logger.error(f"An error occurred: {e}")